@@ -1,26 +1,38 @@
 #!/usr/bin/env python3
 """
 Pure dataclass configurations - no tkinter dependencies.
-Generate GUI wrappers by running: python _config.py
+Generate GUI wrappers by running: python -m gui.core
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, List
+import json
+import os
 import yaml
-from abc import ABC
+
+from utils import vprint
+
+# Prefer the libyaml-backed C implementations when PyYAML was built with them.
+# Both resolve scalars by YAML 1.1 rules (yes/on -> True, 010 -> 8), so a
+# config means the same thing whichever one is available.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 """
 DEVELOPING GUIDE:
 
-1. Define your configuration options here.
+1. Define your configuration options here, decorated with `@_config_section`
+   above `@dataclass(slots=True)` like the sections below.
 
 2. Add them to the __init__.py file in the core module to export them.
 
 3. Add them to the `GUI_CONFIG_CLASSES` list at the bottom.
 
-4. Run this file to generate GUI wrappers in the `gui` module.
+4. Run the generator from the repository root to write GUI wrappers into the
+   `gui` module (gui/config.py is the only place tkinter is imported for configs).
 
-    python core/_config.py
+    python -m gui.core
     
 5. Use the generated GUI classes in your application.
 
@@ -29,10 +41,47 @@ DEVELOPING GUIDE:
 """
 
 
-@dataclass
-class BaseConfig(ABC):
+def _generate_to_dict(
+    config_class,
+    value_suffix: str = "",
+    doc: str = "Convert config to dictionary for serialization.",
+):
+    """Build a straight-line to_dict for a config class."""
+    items = ", ".join(
+        f"{name!r}: self.{name}{value_suffix}"
+        for name in config_class.__field_names__
+    )
+    namespace = {}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", {}, namespace)
+
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{config_class.__qualname__}.to_dict"
+    to_dict.__doc__ = doc
+    return to_dict
+
+
+def _config_section(config_class):
+    """Register a config section for fast serialization.
+
+    Field sets are fixed once @dataclass has run, so the names are cached as a
+    plain tuple and to_dict is generated as a straight-line dict literal. Apply
+    above @dataclass, which has to populate the fields first.
+    """
+    config_class.__field_names__ = tuple(config_class.__dataclass_fields__)
+    config_class.to_dict = _generate_to_dict(config_class)
+    return config_class
+
+
+@dataclass(slots=True)
+class BaseConfig:
     """Base class for all configuration sections."""
 
+    def __init_subclass__(cls, **kwargs):
+        # A generated to_dict only knows its own class's fields, so subclasses
+        # fall back to the generic one until @_config_section registers them
+        if "to_dict" not in cls.__dict__:
+            cls.to_dict = BaseConfig.to_dict
+
     @classmethod
     def from_dict(cls, data: dict) -> "BaseConfig":
         """Create config instance from dictionary."""
@@ -40,13 +89,16 @@ class BaseConfig(ABC):
 
     def to_dict(self) -> dict:
         """Convert config to dictionary for serialization."""
-        return {
-            field_name: getattr(self, field_name)
-            for field_name in self.__dataclass_fields__
-        }
+        # Only trust a cache set on this exact class; a subclass inheriting its
+        # parent's tuple would silently drop its own fields
+        field_names = type(self).__dict__.get("__field_names__")
+        if field_names is None:
+            field_names = [f.name for f in fields(self)]
+        return {name: getattr(self, name) for name in field_names}
 
 
-@dataclass
+@_config_section
+@dataclass(slots=True)
 class InputConfig(BaseConfig):
     """File and data input configuration."""
 
@@ -57,7 +109,8 @@ class InputConfig(BaseConfig):
     new_param: bool = False
 
 
-@dataclass
+@_config_section
+@dataclass(slots=True)
 class ChannelConfig(BaseConfig):
     """Channel selection and processing configuration."""
 
@@ -65,7 +118,8 @@ class ChannelConfig(BaseConfig):
     selected_channel: int = 0  # -3 to 4 range
 
 
-@dataclass
+@_config_section
+@dataclass(slots=True)
 class QualityConfig(BaseConfig):
     """Data quality and acceptance criteria."""
 
@@ -73,7 +127,8 @@ class QualityConfig(BaseConfig):
     accept_dim_channels: bool = False
 
 
-@dataclass
+@_config_section
+@dataclass(slots=True)
 class AnalysisConfig(BaseConfig):
     """Analysis module selection and coordination."""
 
@@ -82,7 +137,8 @@ class AnalysisConfig(BaseConfig):
     enable_intensity_distribution: bool = False
 
 
-@dataclass
+@_config_section
+@dataclass(slots=True)
 class OutputConfig(BaseConfig):
     """Output generation and format configuration."""
 
@@ -92,7 +148,8 @@ class OutputConfig(BaseConfig):
     generate_dataset_barcode: bool = False
 
 
-@dataclass
+@_config_section
+@dataclass(slots=True)
 class BinarizationConfig(BaseConfig):
     """Binarization analysis parameters."""
 
@@ -102,7 +159,8 @@ class BinarizationConfig(BaseConfig):
     frame_stop_percent: float = 1.0  # 0.9 to 1.0
 
 
-@dataclass
+@_config_section
+@dataclass(slots=True)
 class OpticalFlowConfig(BaseConfig):
     """Optical flow analysis parameters."""
 
@@ -110,10 +168,11 @@ class OpticalFlowConfig(BaseConfig):
     window_size: int = 32
     downsample_factor: int = 8  # 1 to 1000
     nm_pixel_ratio: float = 1.0  # 1 to 1,000,000
-    frame_interval_s: int = 1  # 1 to 1000
+    frame_interval_s: float = 1.0  # 1 to 1000
 
 
-@dataclass
+@_config_section
+@dataclass(slots=True)
 class IntensityDistributionConfig(BaseConfig):
     """Intensity distribution analysis parameters."""
 
@@ -122,7 +181,8 @@ class IntensityDistributionConfig(BaseConfig):
     frames_evaluation_percent: float = 0.1  # 0.01 to 0.2
 
 
-@dataclass
+@_config_section
+@dataclass(slots=True)
 class PreviewConfig(BaseConfig):
     """GUI preview and visualization settings."""
 
@@ -130,7 +190,8 @@ class PreviewConfig(BaseConfig):
     enable_live_preview: bool = True
 
 
-@dataclass
+@_config_section
+@dataclass(slots=True)
 class AggregationConfig(BaseConfig):
     """CSV aggregation and post-processing configuration."""
 
@@ -141,7 +202,7 @@ class AggregationConfig(BaseConfig):
     csv_paths_list: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class BarcodeConfig:
     """Main configuration container for BARCODE application."""
 
@@ -158,62 +219,75 @@ class BarcodeConfig:
         default_factory=IntensityDistributionConfig
     )
 
+    # to_dict (sections as nested dictionaries) is generated at the bottom of
+    # this module by _generate_to_dict
+
     def save_to_yaml(self, filepath: str) -> None:
         """Save configuration to YAML file."""
-        config_data = {}
-        for field_name in self.__dataclass_fields__:
-            subconfig = getattr(self, field_name)
-            config_data[field_name] = subconfig.to_dict()
-
+        # Serialized by the _ConfigDumper representers while dumping
         with open(filepath, "w") as f:
-            yaml.dump(config_data, f, default_flow_style=False, indent=2)
+            yaml.dump(self, f, Dumper=_ConfigDumper, default_flow_style=False, indent=2)
+
+    @classmethod
+    def load_from_file(cls, filepath: str) -> "BarcodeConfig":
+        """Load configuration from a JSON or YAML file, based on its extension."""
+        if os.path.splitext(filepath)[1].lower() == ".json":
+            return cls.load_from_json(filepath)
+        return cls.load_from_yaml(filepath)
+
+    @classmethod
+    def load_from_json(cls, filepath: str) -> "BarcodeConfig":
+        """Load configuration from JSON file."""
+        with open(filepath, "r") as f:
+            config_data = json.load(f)
+
+        if not isinstance(config_data, dict):
+            raise ValueError("Error loading JSON: expected a dictionary structure")
+
+        try:
+            return cls.from_dict(config_data)
+        except KeyError as e:
+            raise ValueError(f"Unknown JSON format in {filepath} ({e.args[0]})") from e
 
     @classmethod
     def load_from_yaml(cls, filepath: str) -> "BarcodeConfig":
         """Load configuration from YAML file."""
         with open(filepath, "r") as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=_Loader)
 
         if not isinstance(config_data, dict):
             raise ValueError("Error loading YAML: expected a dictionary structure")
 
         try:
-            return cls._load_from_yaml(config_data)
+            return cls.from_dict(config_data)
         except (KeyError, AssertionError) as e:
-            print(f"Error loading YAML: {e}")
-            pass
+            vprint("Error loading YAML:", e)
+            current_error = e
 
-        print(f"Attempting to load legacy YAML format from {filepath}")
+        vprint("Attempting to load legacy YAML format from", filepath)
         try:
             return cls._load_from_legacy_yaml(config_data)
         except (KeyError, AssertionError) as e:
-            print(f"Error loading legacy YAML: {e}")
-            pass
+            vprint("Error loading legacy YAML:", e)
+            legacy_error = e
 
-        raise ValueError(f"Unknown YAML format in {filepath}")
+        raise ValueError(
+            f"Unknown YAML format in {filepath} "
+            f"(current format: {current_error}; legacy format: missing {legacy_error})"
+        )
 
     @classmethod
-    def _load_from_yaml(cls, config_data: Dict[str, Any]) -> "BarcodeConfig":
-        """Load configuration from YAML data."""
+    def from_dict(cls, config_data: Dict[str, Any]) -> "BarcodeConfig":
+        """Create configuration from nested section dictionaries."""
+
+        subconfig_classes = cls._SUBCONFIG_CLASSES
 
         kwargs = {}
         for subconfig_class_name, subconfig_data in config_data.items():
+            if subconfig_class_name not in subconfig_classes:
+                raise KeyError(f"Unknown configuration section: {subconfig_class_name}")
 
-            assert (
-                subconfig_class_name in cls.__dataclass_fields__
-            ), f"Unknown configuration section: {subconfig_class_name}"
-
-            field_info = cls.__dataclass_fields__[subconfig_class_name]
-            subconfig_class = field_info.default_factory
-
-            assert callable(
-                subconfig_class
-            ), f"Expected {subconfig_class_name} to be a callable class, got {subconfig_class}"
-            assert issubclass(
-                subconfig_class, BaseConfig
-            ), f"Expected {subconfig_class_name} to be a subclass of BaseConfig"
-
-            # Get the config class and create new instance from dict
+            subconfig_class = subconfig_classes[subconfig_class_name]
             kwargs[subconfig_class_name] = subconfig_class.from_dict(subconfig_data)
 
         return cls(**kwargs)
@@ -292,20 +366,46 @@ GUI_CONFIG_CLASSES = [
 ]
 
 
-if __name__ == "__main__":
-    import sys, os
+# BarcodeConfig is not a section, so it gets its cached field names and
+# generated to_dict here rather than through @_config_section
+BarcodeConfig.__field_names__ = tuple(BarcodeConfig.__dataclass_fields__)
+BarcodeConfig.to_dict = _generate_to_dict(
+    BarcodeConfig,
+    ".to_dict()",
+    doc="Convert all config sections to nested dictionaries.",
+)
+
 
-    # Add the parent directory to sys.path to import core.config
-    sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-    from gui.core import create_gui_configs
+class _ConfigDumper(_Dumper):
+    """Dumper that knows how to represent config objects.
 
-    # Generate GUI configs
-    num_generated = create_gui_configs(GUI_CONFIG_CLASSES)
+    Representers are registered on this subclass so PyYAML's shared
+    SafeDumper/CSafeDumper classes are left untouched for other callers.
+    """
 
-    print("\n📋 Usage:")
-    print("  from gui import BarcodeConfigGUI")
-    print("  from gui import BinarizationConfigGUI as BinGUI  # Optional short names")
-    print("  gui_config = BarcodeConfigGUI(core_config)")
-    print(
-        "  threshold_slider = ttk.Scale(textvariable=gui_config.binarization.threshold_offset)"
+
+def _represent_barcode_config(dumper, config):
+    # Hand over the section objects themselves, not their nested dicts
+    return dumper.represent_dict(
+        {name: getattr(config, name) for name in config.__field_names__}
     )
+
+
+def _represent_config_section(dumper, section):
+    return dumper.represent_dict(section.to_dict())
+
+
+# Let PyYAML walk the config sections itself instead of pre-building a dict tree
+_ConfigDumper.add_representer(BarcodeConfig, _represent_barcode_config)
+_ConfigDumper.add_multi_representer(BaseConfig, _represent_config_section)
+
+# Map each BarcodeConfig section to its config class once, so loading is a
+# plain dict lookup per section. Sections are checked here, not on every load.
+BarcodeConfig._SUBCONFIG_CLASSES = {
+    _field_name: _field_info.default_factory
+    for _field_name, _field_info in BarcodeConfig.__dataclass_fields__.items()
+}
+for _field_name, _subconfig_class in BarcodeConfig._SUBCONFIG_CLASSES.items():
+    assert isinstance(_subconfig_class, type) and issubclass(
+        _subconfig_class, BaseConfig
+    ), f"Expected {_field_name} to be a subclass of BaseConfig"
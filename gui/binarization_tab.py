@@ -232,6 +232,9 @@ def create_binarization_frame(
             sample_file_combobox["values"] = []
             sample_file_combobox.config(state="disabled")
 
+    # Pick up a directory chosen before this tab was built
+    update_sample_file_options()
+
     # Wire up events
     ci.file_path.trace_add("write", load_preview_frame)
     cp.sample_file.trace_add("write", load_preview_frame)
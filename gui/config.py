@@ -1,13 +1,13 @@
 """
 Auto-generated GUI wrappers for config classes
-Generated by: python config.py
+Generated by: python -m gui.core
 """
 
 from dataclasses import dataclass, field
 import tkinter as tk
 from core.config import *
 
-@dataclass
+@dataclass(slots=True)
 class InputConfigGUI:
     """Auto-generated GUI wrapper for InputConfig"""
     _core_config: InputConfig = field(default_factory=InputConfig)
@@ -45,7 +45,7 @@ class InputConfigGUI:
         self.configuration_file.set(new_config.configuration_file)
         self.new_param.set(new_config.new_param)
 
-@dataclass
+@dataclass(slots=True)
 class ChannelConfigGUI:
     """Auto-generated GUI wrapper for ChannelConfig"""
     _core_config: ChannelConfig = field(default_factory=ChannelConfig)
@@ -71,7 +71,7 @@ class ChannelConfigGUI:
         self.parse_all_channels.set(new_config.parse_all_channels)
         self.selected_channel.set(new_config.selected_channel)
 
-@dataclass
+@dataclass(slots=True)
 class QualityConfigGUI:
     """Auto-generated GUI wrapper for QualityConfig"""
     _core_config: QualityConfig = field(default_factory=QualityConfig)
@@ -97,7 +97,7 @@ class QualityConfigGUI:
         self.accept_dim_images.set(new_config.accept_dim_images)
         self.accept_dim_channels.set(new_config.accept_dim_channels)
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisConfigGUI:
     """Auto-generated GUI wrapper for AnalysisConfig"""
     _core_config: AnalysisConfig = field(default_factory=AnalysisConfig)
@@ -127,7 +127,7 @@ class AnalysisConfigGUI:
         self.enable_optical_flow.set(new_config.enable_optical_flow)
         self.enable_intensity_distribution.set(new_config.enable_intensity_distribution)
 
-@dataclass
+@dataclass(slots=True)
 class OutputConfigGUI:
     """Auto-generated GUI wrapper for OutputConfig"""
     _core_config: OutputConfig = field(default_factory=OutputConfig)
@@ -161,7 +161,7 @@ class OutputConfigGUI:
         self.save_intermediates.set(new_config.save_intermediates)
         self.generate_dataset_barcode.set(new_config.generate_dataset_barcode)
 
-@dataclass
+@dataclass(slots=True)
 class BinarizationConfigGUI:
     """Auto-generated GUI wrapper for BinarizationConfig"""
     _core_config: BinarizationConfig = field(default_factory=BinarizationConfig)
@@ -195,7 +195,7 @@ class BinarizationConfigGUI:
         self.frame_start_percent.set(new_config.frame_start_percent)
         self.frame_stop_percent.set(new_config.frame_stop_percent)
 
-@dataclass
+@dataclass(slots=True)
 class OpticalFlowConfigGUI:
     """Auto-generated GUI wrapper for OpticalFlowConfig"""
     _core_config: OpticalFlowConfig = field(default_factory=OpticalFlowConfig)
@@ -204,14 +204,14 @@ class OpticalFlowConfigGUI:
     window_size: tk.IntVar = field(init=False)
     downsample_factor: tk.IntVar = field(init=False)
     nm_pixel_ratio: tk.DoubleVar = field(init=False)
-    frame_interval_s: tk.IntVar = field(init=False)
+    frame_interval_s: tk.DoubleVar = field(init=False)
 
     def __post_init__(self):
         self.frame_step = tk.IntVar(value=self._core_config.frame_step)
         self.window_size = tk.IntVar(value=self._core_config.window_size)
         self.downsample_factor = tk.IntVar(value=self._core_config.downsample_factor)
         self.nm_pixel_ratio = tk.DoubleVar(value=self._core_config.nm_pixel_ratio)
-        self.frame_interval_s = tk.IntVar(value=self._core_config.frame_interval_s)
+        self.frame_interval_s = tk.DoubleVar(value=self._core_config.frame_interval_s)
 
     @property
     def config(self) -> OpticalFlowConfig:
@@ -233,7 +233,7 @@ class OpticalFlowConfigGUI:
         self.nm_pixel_ratio.set(new_config.nm_pixel_ratio)
         self.frame_interval_s.set(new_config.frame_interval_s)
 
-@dataclass
+@dataclass(slots=True)
 class IntensityDistributionConfigGUI:
     """Auto-generated GUI wrapper for IntensityDistributionConfig"""
     _core_config: IntensityDistributionConfig = field(default_factory=IntensityDistributionConfig)
@@ -263,7 +263,7 @@ class IntensityDistributionConfigGUI:
         self.last_frame.set(new_config.last_frame)
         self.frames_evaluation_percent.set(new_config.frames_evaluation_percent)
 
-@dataclass
+@dataclass(slots=True)
 class PreviewConfigGUI:
     """Auto-generated GUI wrapper for PreviewConfig"""
     _core_config: PreviewConfig = field(default_factory=PreviewConfig)
@@ -289,7 +289,7 @@ class PreviewConfigGUI:
         self.sample_file.set(new_config.sample_file)
         self.enable_live_preview.set(new_config.enable_live_preview)
 
-@dataclass
+@dataclass(slots=True)
 class AggregationConfigGUI:
     """Auto-generated GUI wrapper for AggregationConfig"""
     _core_config: AggregationConfig = field(default_factory=AggregationConfig)
@@ -327,7 +327,7 @@ class AggregationConfigGUI:
         self.normalize_barcode.set(new_config.normalize_barcode)
         self.csv_paths_list.set(new_config.csv_paths_list)
 
-@dataclass
+@dataclass(slots=True)
 class BarcodeConfigGUI:
     """Auto-generated master GUI configuration"""
     _core_config: BarcodeConfig = field(default_factory=BarcodeConfig)
@@ -360,4 +360,19 @@ class BarcodeConfigGUI:
             binarization=self.binarization.config,
             optical_flow=self.optical_flow.config,
             intensity_distribution=self.intensity_distribution.config,
-        )
\ No newline at end of file
+        )
+
+    def update_gui(self, new_config: BarcodeConfig):
+        """Update all GUI values from new config, reusing the tk variables"""
+        self._core_config = new_config
+        self.channels.update_gui(new_config.channels)
+        self.quality.update_gui(new_config.quality)
+        self.analysis.update_gui(new_config.analysis)
+        self.output.update_gui(new_config.output)
+        self.binarization.update_gui(new_config.binarization)
+        self.optical_flow.update_gui(new_config.optical_flow)
+        self.intensity_distribution.update_gui(new_config.intensity_distribution)
+
+    def load_into(self, filepath: str):
+        """Load a YAML or JSON configuration into the existing GUI values"""
+        self.update_gui(BarcodeConfig.load_from_file(filepath))
\ No newline at end of file
@@ -23,7 +23,7 @@ def generate_gui_wrapper(config_class):
     class_name = f"{config_class.__name__}GUI"
 
     lines = [
-        f"@dataclass",
+        f"@dataclass(slots=True)",
         f"class {class_name}:",
         f'    """Auto-generated GUI wrapper for {config_class.__name__}"""',
         f"    _core_config: {config_class.__name__} = field(default_factory={config_class.__name__})",
@@ -84,7 +84,7 @@ def generate_gui_wrapper(config_class):
 def generate_master_gui_config():
     """Generate BarcodeConfigGUI."""
     lines = [
-        "@dataclass",
+        "@dataclass(slots=True)",
         "class BarcodeConfigGUI:",
         '    """Auto-generated master GUI configuration"""',
         "    _core_config: BarcodeConfig = field(default_factory=BarcodeConfig)",
@@ -129,6 +129,31 @@ def generate_master_gui_config():
 
     lines.append("        )")
 
+    # Generate update_gui method
+    lines.extend(
+        [
+            "",
+            "    def update_gui(self, new_config: BarcodeConfig):",
+            '        """Update all GUI values from new config, reusing the tk variables"""',
+            "        self._core_config = new_config",
+        ]
+    )
+
+    for field_name in BarcodeConfig.__dataclass_fields__:
+        lines.append(
+            f"        self.{field_name}.update_gui(new_config.{field_name})"
+        )
+
+    # Generate load_into method
+    lines.extend(
+        [
+            "",
+            "    def load_into(self, filepath: str):",
+            '        """Load a YAML or JSON configuration into the existing GUI values"""',
+            "        self.update_gui(BarcodeConfig.load_from_file(filepath))",
+        ]
+    )
+
     return "\n".join(lines)
 
 
@@ -137,7 +162,7 @@ def generate_gui_module(config_classes_to_generate):
     lines = [
         '"""',
         "Auto-generated GUI wrappers for config classes",
-        "Generated by: python config.py",
+        "Generated by: python -m gui.core",
         '"""',
         "",
         "from dataclasses import dataclass, field",
@@ -174,3 +199,16 @@ def create_gui_configs(config_classes_to_generate, output_dir="gui"):
     print(f"📁 Generated {len(config_classes_to_generate)} config GUIs")
 
     return len(config_classes_to_generate)
+
+
+if __name__ == "__main__":
+    # Generate GUI configs
+    num_generated = create_gui_configs(GUI_CONFIG_CLASSES)
+
+    print("\n📋 Usage:")
+    print("  from gui.config import BarcodeConfigGUI")
+    print("  from gui.config import BinarizationConfigGUI as BinGUI  # Optional short names")
+    print("  gui_config = BarcodeConfigGUI(core_config)")
+    print(
+        "  threshold_slider = ttk.Scale(textvariable=gui_config.binarization.threshold_offset)"
+    )
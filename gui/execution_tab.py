@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import ttk, filedialog
+from tkinter import ttk, filedialog, messagebox
 
 # from core import BarcodeConfig, InputConfig
 from gui.config import BarcodeConfigGUI, InputConfigGUI
@@ -193,7 +193,7 @@ def create_execution_frame(parent, config: BarcodeConfigGUI, input_config: Input
     row_idx += 2
 
     # Configuration file
-    tk.Label(frame, text="Configuration YAML File:").grid(
+    tk.Label(frame, text="Configuration File:").grid(
         row=row_idx, column=0, sticky="w", padx=5, pady=2
     )
     config_entry = tk.Entry(frame, textvariable=ci.configuration_file, width=35)
@@ -201,13 +201,25 @@ def create_execution_frame(parent, config: BarcodeConfigGUI, input_config: Input
 
     def browse_config_file():
         chosen = filedialog.askopenfilename(
-            filetypes=[("YAML Files", "*.yaml"), ("YAML Files", "*.yml")],
-            title="Select a Configuration YAML",
+            filetypes=[
+                ("YAML Files", "*.yaml"),
+                ("YAML Files", "*.yml"),
+                ("JSON Files", "*.json"),
+            ],
+            title="Select a Configuration File",
         )
-        if chosen:
-            ci.configuration_file.set(chosen)
-
-    tk.Button(frame, text="Browse YAML...", command=browse_config_file).grid(
+        if not chosen:
+            return
+
+        # Show the file's settings in the existing widgets
+        try:
+            config.load_into(chosen)
+        except Exception as e:
+            messagebox.showerror("Error reading config file", str(e))
+            return
+        ci.configuration_file.set(chosen)
+
+    tk.Button(frame, text="Browse Config...", command=browse_config_file).grid(
         row=row_idx, column=2, sticky="w", padx=5
     )
 
@@ -1,10 +1,19 @@
+import functools
+import multiprocessing
+import os
+import queue
+import sys
 import threading
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import matplotlib
 from tkinter import ttk, messagebox
 
 from core import BarcodeConfig, InputConfig, PreviewConfig, AggregationConfig
+from core.pipeline import run_analysis
+from utils.writer import generate_aggregate_csv
 
 from gui import (
     create_barcode_frame,
@@ -26,32 +35,196 @@ from gui.config import (
 matplotlib.use("Agg")
 
 
+class _QueueWriter:
+    """File-like object that forwards writes to a multiprocessing queue"""
+
+    def __init__(self, log_queue):
+        self.log_queue = log_queue
+
+    def write(self, msg):
+        self.log_queue.put(msg)
+
+    def flush(self):
+        pass
+
+
+def _init_analysis_process(log_queue):
+    """Send the analysis process's output back to the GUI log window"""
+    sys.stdout = _QueueWriter(log_queue)
+    sys.stderr = _QueueWriter(log_queue)
+
+
+def _terminate_workers(executor: ProcessPoolExecutor) -> None:
+    """Kill an executor's worker processes, abandoning any running task"""
+    # ProcessPoolExecutor has no public way to stop a running task. Its
+    # _processes dict is a CPython implementation detail (present in 3.9-3.13);
+    # if it ever goes away, shutdown() below still stops new work, just not the
+    # task already running
+    processes = getattr(executor, "_processes", None) or {}
+    for process in list(processes.values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _AnalysisProcess:
+    """Single worker process for run_analysis that can be restarted or killed"""
+
+    def __init__(self, log_queue):
+        self._log_queue = log_queue
+        self._lock = threading.Lock()
+        self._closed = False
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # spawn avoids forking a process that already has Tk initialized
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_analysis_process,
+            initargs=(self._log_queue,),
+        )
+
+    def warm_up(self) -> None:
+        """Start the worker process now rather than on the first run"""
+        with self._lock:
+            if self._closed:
+                return
+            executor = self._executor
+
+        # Workers are only spawned on submit, and a spawned worker re-imports
+        # main.py with tkinter, numpy and matplotlib before it can take a task
+        executor.submit(int)
+
+    def run_analysis(self, dir_name: str, config: BarcodeConfig) -> None:
+        """Run the analysis in the worker process and wait for it to finish"""
+        with self._lock:
+            executor = self._executor
+
+        try:
+            executor.submit(run_analysis, dir_name, config).result()
+        except BrokenProcessPool:
+            # A crashed worker (segfault, OOM kill) breaks the pool for good,
+            # so start a fresh one for the next run before reporting the error
+            with self._lock:
+                cancelled = self._executor is not executor
+                restart = not self._closed and not cancelled
+                if restart:
+                    self._executor = self._create_executor()
+            if cancelled:
+                raise RuntimeError("Program Terminated Early") from None
+            if restart:
+                self.warm_up()
+            raise
+
+    def cancel(self):
+        """Kill any analysis in progress and start a fresh worker process"""
+        with self._lock:
+            if self._closed:
+                return
+            executor = self._executor
+            self._executor = self._create_executor()
+
+        _terminate_workers(executor)
+        self.warm_up()
+
+    def terminate(self):
+        """Kill the worker process, abandoning any analysis in progress"""
+        with self._lock:
+            self._closed = True
+            executor = self._executor
+
+        # Otherwise the executor's exit hook keeps the app alive until the
+        # analysis ends
+        _terminate_workers(executor)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime: float) -> BarcodeConfig:
+    """Load a configuration file, keyed on its mtime so edits invalidate it"""
+    return BarcodeConfig.load_from_file(path)
+
+
 def create_tabs(
     parent,
     config: BarcodeConfigGUI,
     input_config: InputConfigGUI,
     preview_config: PreviewConfigGUI,
     aggregation_config: AggregationConfigGUI,
+    on_tabs_built=None,
 ):
     """Create all tabs using our extracted components"""
     notebook = ttk.Notebook(parent, takefocus=0)
     notebook.pack(fill="both", expand=True)
 
-    # Create all tabs
-    execution_frame = create_execution_frame(notebook, config, input_config)
-    binarization_frame = create_binarization_frame(
-        notebook, config, preview_config, input_config
-    )
-    flow_frame = create_flow_frame(notebook, config)
-    intensity_frame = create_intensity_frame(notebook, config)
-    barcode_frame = create_barcode_frame(notebook, config, aggregation_config)
+    # Only the first tab is built before the window is shown; the rest are
+    # built right after startup, or earlier if the user selects them first
+    tab_builders = [
+        (
+            "Execution Settings",
+            functools.partial(
+                create_execution_frame, config=config, input_config=input_config
+            ),
+        ),
+        (
+            "Binarization Settings",
+            functools.partial(
+                create_binarization_frame,
+                config=config,
+                preview_config=preview_config,
+                input_config=input_config,
+            ),
+        ),
+        (
+            "Optical Flow Settings",
+            functools.partial(create_flow_frame, config=config),
+        ),
+        (
+            "Intensity Distribution Settings",
+            functools.partial(create_intensity_frame, config=config),
+        ),
+        (
+            "Barcode Generator + CSV Aggregator",
+            functools.partial(
+                create_barcode_frame,
+                config=config,
+                aggregation_config=aggregation_config,
+            ),
+        ),
+    ]
+
+    # Add empty placeholder tabs to notebook
+    tab_frames = []
+    for title, _ in tab_builders:
+        tab_frame = ttk.Frame(notebook)
+        notebook.add(tab_frame, text=title)
+        tab_frames.append(tab_frame)
+
+    populated = set()
+
+    def populate_tab(index: int):
+        if index in populated:
+            return
+        populated.add(index)
+        _, build_frame = tab_builders[index]
+        build_frame(tab_frames[index]).pack(fill="both", expand=True)
 
-    # Add tabs to notebook
-    notebook.add(execution_frame, text="Execution Settings")
-    notebook.add(binarization_frame, text="Binarization Settings")
-    notebook.add(flow_frame, text="Optical Flow Settings")
-    notebook.add(intensity_frame, text="Intensity Distribution Settings")
-    notebook.add(barcode_frame, text="Barcode Generator + CSV Aggregator")
+    def on_tab_changed(event):
+        populate_tab(notebook.index(notebook.select()))
+
+    notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+
+    def populate_remaining_tabs(index: int = 1):
+        if index == len(tab_builders):
+            if on_tabs_built is not None:
+                on_tabs_built()
+            return
+        populate_tab(index)
+        # Yield to the event loop between tabs so the window stays responsive
+        notebook.after(1, populate_remaining_tabs, index + 1)
+
+    populate_tab(0)
+    # A timer rather than after_idle, which update_idletasks() would run early
+    notebook.after(100, populate_remaining_tabs)
 
     return notebook
 
@@ -60,23 +233,15 @@ def create_processing_worker(
     config: BarcodeConfig,
     input_config: InputConfig,
     aggregation_config: AggregationConfig,
+    analysis_process: _AnalysisProcess,
 ):
     """Create the worker function for processing in background thread"""
 
-    if input_config.configuration_file:
-        try:
-            config = BarcodeConfig.load_from_yaml(input_config.configuration_file)
-        except Exception as e:
-            messagebox.showerror("Error reading config file", str(e))
-            return
-
     def worker():
         try:
             mode = input_config.mode
 
             if mode == "agg":
-                from utils.writer import generate_aggregate_csv
-
                 # Handle CSV aggregation
                 combined_location = aggregation_config.output_location
                 generate_agg_barcode = aggregation_config.generate_barcode
@@ -98,8 +263,6 @@ def create_processing_worker(
                 )
 
             else:
-                from core.pipeline import run_analysis
-
                 # Handle file/directory processing
                 file_path = input_config.file_path
                 dir_path = input_config.dir_path
@@ -118,7 +281,9 @@ def create_processing_worker(
 
                 dir_name = dir_path if dir_path else file_path
 
-                run_analysis(dir_name, config)
+                # The analysis runs in a separate process so it does not hold the
+                # GIL against the Tk event loop; this thread only waits on it
+                analysis_process.run_analysis(dir_name, config)
 
         except Exception as e:
             print(f"Error during processing: {e}")
@@ -146,38 +311,91 @@ def main():
     gui_preview_config = PreviewConfigGUI()
     gui_aggregation_config = AggregationConfigGUI()
 
-    # Create tabs
+    def fit_canvas_to_content():
+        root.update_idletasks()
+        bbox = canvas.bbox("all")
+        if bbox:
+            content_width = bbox[2] - bbox[0]
+            content_height = bbox[3] - bbox[1]
+            canvas.config(width=content_width, height=content_height)
+            root.update_idletasks()
+
+    # Create tabs, resizing to the largest one once they are all built
     create_tabs(
         scrollable_frame,
         gui_config,
         gui_input_config,
         gui_preview_config,
         gui_aggregation_config,
+        on_tabs_built=fit_canvas_to_content,
     )
 
+    # Analysis process, with its output forwarded to the log window
+    log_queue = multiprocessing.get_context("spawn").Queue()
+    analysis_process = _AnalysisProcess(log_queue)
+
+    def drain_log_queue():
+        try:
+            while True:
+                try:
+                    msg = log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    print(msg, end="")
+                except Exception:
+                    # The log window was closed. As when the analysis ran in
+                    # this process, that stops it; leftover output goes to the
+                    # console until the next run opens a new log window
+                    sys.stdout = sys.__stdout__
+                    sys.stderr = sys.__stderr__
+                    print(msg, end="")
+                    analysis_process.cancel()
+        finally:
+            root.after(100, drain_log_queue)
+
+    drain_log_queue()
+
     # Run button
     def on_run():
         setup_log_window(root)
 
         # Convert GUI configs to pure data configs
-        config = gui_config.config
         input_config = gui_input_config.config
         aggregation_config = gui_aggregation_config.config
 
-        worker = create_processing_worker(config, input_config, aggregation_config)
+        # A configuration file overrides the GUI settings entirely
+        if input_config.configuration_file:
+            try:
+                config_path = input_config.configuration_file
+                # Safe to share: the analysis process works on a pickled copy
+                config = _load_config_cached(config_path, os.path.getmtime(config_path))
+            except Exception as e:
+                messagebox.showerror("Error reading config file", str(e))
+                return
+        else:
+            config = gui_config.config
+
+        worker = create_processing_worker(
+            config, input_config, aggregation_config, analysis_process
+        )
         threading.Thread(target=worker, daemon=True).start()
 
     run_button = ttk.Button(root, text="Run", command=on_run)
     run_button.grid(row=1, column=0, pady=10, sticky="n")
 
     # Configure canvas sizing
-    root.update_idletasks()
-    bbox = canvas.bbox("all")
-    if bbox:
-        content_width = bbox[2] - bbox[0]
-        content_height = bbox[3] - bbox[1]
-        canvas.config(width=content_width, height=content_height)
-        root.update_idletasks()
+    fit_canvas_to_content()
+
+    # Closing the window ends any analysis in progress, like the app exiting
+    def on_close():
+        analysis_process.terminate()
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
+
+    # Pay for the worker's startup once the window is up, not on the first Run
+    root.after_idle(analysis_process.warm_up)
 
     root.mainloop()
 
@@ -175,7 +175,7 @@ def extract_nd2_metadata(filepath: str, config: BarcodeConfig) -> None:
         with nd2.ND2File(filepath) as ndfile:
             # Extract frame timing metadata
             times = ndfile.events(orient="list")["Time [s]"]
-            frame_interval = np.array([y - x for x, y in pairwise(times)]).mean()
+            frame_interval = float(np.array([y - x for x, y in pairwise(times)]).mean())
 
             # Extract spatial metadata
             nm_pix_ratio = 1000 / (ndfile.voxel_size()[0])